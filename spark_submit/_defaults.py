@@ -1,39 +1,72 @@
 """Some basic default spark-submit arguments and driver end states"""
-import os
-from typing import Any, Dict, Set
-
-__defaults__: Dict[str, Any] = {
-    'spark_home': os.getenv('SPARK_HOME', os.path.expanduser('~/spark_home')),
-    'master': 'local[*]',
-    'name': 'spark-submit-task',
-    'deploy_mode': 'client',
-    'driver_memory': '1g',
-    'executor_memory': '1g',
-    'executor_cores': '1',
-    'total_executor_cores': '2',
-    'py_files': None,
-    'files': None,
-    'class': None,
-    'jars': None,
-    'packages': None,
-    'exclude_packages': None,
-    'repositories': None,
-    'verbose': False,
-    'supervise': False,
-    'properties_file': None,
-    'conf': [],
-    'main_file_args': '',
-}
-
-# Possible Spark driver states:
-# SUBMITTED: Submitted but not yet scheduled on a worker
-# RUNNING: Has been allocated to a worker to run
-# FINISHED: Previously ran and exited cleanly
-# RELAUNCHING: Exited non-zero or due to worker failure, but has not yet started running again
-# UNKNOWN: The state of the driver is temporarily not known due to master failure recovery
-# KILLED: A user manually killed this driver
-# FAILED: The driver exited non-zero and was not supervised
-# ERROR: Unable to run or restart due to an unrecoverable error (e.g. missing jar file)
-
-# states that conclude a job
-__end_states__: Set[str] = {'FINISHED', 'UNKNOWN', 'KILLED', 'FAILED', 'ERROR'}
+from enum import IntFlag
+from types import MappingProxyType
+from typing import Any, FrozenSet, Mapping
+
+# read-only, shared by all SparkJob instances which only store their own overrides
+__defaults__: Mapping[str, Any] = MappingProxyType(
+    {
+        'spark_home': None,  # resolved from SPARK_HOME when the job is created
+        'master': 'local[*]',
+        'name': 'spark-submit-task',
+        'deploy_mode': 'client',
+        'driver_memory': '1g',
+        'executor_memory': '1g',
+        'executor_cores': '1',
+        'total_executor_cores': '2',
+        'py_files': None,
+        'files': None,
+        'class': None,
+        'jars': None,
+        'packages': None,
+        'exclude_packages': None,
+        'repositories': None,
+        'verbose': False,
+        'supervise': False,
+        'properties_file': None,
+        'conf': [],
+        'main_file_args': '',
+    }
+)
+
+# arguments that are not rendered as `--arg value` pairs in the spark-submit command
+__static_exclude__: FrozenSet[str] = frozenset({'spark_home', 'main_file', 'conf', 'main_file_args'})
+
+
+class DriverState(IntFlag):
+    """Possible Spark driver states, as bit flags so that groups of states can be tested with a single `&`"""
+
+    SUBMITTED = 1  # Submitted but not yet scheduled on a worker
+    RUNNING = 2  # Has been allocated to a worker to run
+    FINISHED = 4  # Previously ran and exited cleanly
+    RELAUNCHING = 8  # Exited non-zero or due to worker failure, but has not yet started running again
+    UNKNOWN = 16  # The state of the driver is temporarily not known due to master failure recovery
+    KILLED = 32  # A user manually killed this driver
+    FAILED = 64  # The driver exited non-zero and was not supervised
+    ERROR = 128  # Unable to run or restart due to an unrecoverable error (e.g. missing jar file)
+
+    # states that conclude a job
+    TERMINAL = FINISHED | UNKNOWN | KILLED | FAILED | ERROR
+
+
+# YARN application states (as reported by the ResourceManager REST API) mapped to Spark driver states;
+# applications in state FINISHED are mapped through their final status instead
+__yarn_states__: Mapping[str, str] = MappingProxyType(
+    {
+        'NEW': 'SUBMITTED',
+        'NEW_SAVING': 'SUBMITTED',
+        'SUBMITTED': 'SUBMITTED',
+        'ACCEPTED': 'SUBMITTED',
+        'RUNNING': 'RUNNING',
+        'FAILED': 'FAILED',
+        'KILLED': 'KILLED',
+    }
+)
+__yarn_final_statuses__: Mapping[str, str] = MappingProxyType(
+    {
+        'SUCCEEDED': 'FINISHED',
+        'FAILED': 'FAILED',
+        'KILLED': 'KILLED',
+        'UNDEFINED': 'UNKNOWN',
+    }
+)
@@ -1,16 +1,79 @@
 """SparkJob class functionality"""
+import heapq
+import itertools
+import json
 import logging
 import os
 import re
+import shlex
 import threading
 import time
-from typing import Any, Dict, List, Optional, Tuple
-
-import requests
-
-from ._defaults import __defaults__, __end_states__
+from collections import ChainMap
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Type
+
+from ._defaults import (
+    DriverState,
+    __defaults__,
+    __static_exclude__,
+    __yarn_final_statuses__,
+    __yarn_states__,
+)
 from .exceptions import SparkJobKillError, SparkSubmitError
-from .system import _execute_cmd
+from .system import _IS_WINDOWS, _SPARK_SUBMIT_BIN, _execute_cmd, _get_spark_home, _is_file, _normalize_path
+
+if TYPE_CHECKING:
+    import requests
+
+# main_file locations that are not checked on the local file system
+_REMOTE_PREFIXES = (
+    's3://',
+    's3a://',
+    's3n://',
+    'local:',
+    'hdfs://',
+    'gs://',
+    'abfs://',
+    'abfss://',
+    'wasb://',
+    'wasbs://',
+    'http://',
+    'https://',
+)
+
+_DRIVER_STATE_RE = re.compile(r'"driverState" : "([^"]+)"')
+_YARN_ID_RE = re.compile(r'(application[0-9_]+)')
+_K8S_ID_RE = re.compile(r'\s*pod name: ((?:.+?)-(?:[a-z0-9]+)-driver)')
+_STANDALONE_ID_RE = re.compile(r'"submissionId" : "([^"]+)"')
+
+# (connect, read) timeouts in seconds
+_HTTP_TIMEOUT = (3.05, 10)
+
+# upper bound (in seconds) for the backoff of background polling
+_MAX_POLL_INTERVAL = 30
+
+# consecutive failed state checks after which the driver state is given up as UNKNOWN
+_MAX_POLL_FAILURES = 3
+
+# names of the driver states that conclude a job, so that stored states are checked without enum lookups
+_TERMINAL_NAMES = frozenset(
+    name
+    for name, state in DriverState.__members__.items()
+    if state & DriverState.TERMINAL and state is not DriverState.TERMINAL
+)
+
+
+@lru_cache(maxsize=1)
+def _get_session() -> 'requests.Session':
+    """Shared HTTP session, so that status polls and kill requests reuse keep-alive connections.
+    `requests` is imported on first use, as only jobs checked over HTTP need it"""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=4))
+    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4))
+    return session
 
 
 class SparkJob:
@@ -18,6 +81,10 @@ class SparkJob:
 
     Parameters
         main_file (str): location of entry .jar or .py file (either local or on cloud)
+        min_poll_interval (float): minimum number of seconds between two driver state checks; more frequent
+                                   calls to `get_state` return the last known state (default: 1.0)
+        yarn_rm_url (str): YARN ResourceManager web address (e.g. `http://rm-host:8088`); if given, the state of
+                           YARN applications is read from its REST API instead of the `yarn` CLI (default: None)
         **spark_args (Any): keyword arguments used to create a spark-submit command
             Examples:
                 For a typical spark-submit CLI argument `--foo-bar baz`, use `foo_bar='baz'`
@@ -29,34 +96,42 @@ class SparkJob:
         SparkJob: a SparkJob object ready to be submitted against Spark master
     """
 
-    def __init__(self, main_file: str, **spark_args: Any) -> None:
-        self.spark_args = {**__defaults__, **spark_args}
+    def __init__(
+        self,
+        main_file: str,
+        *,
+        min_poll_interval: float = 1.0,
+        yarn_rm_url: Optional[str] = None,
+        **spark_args: Any,
+    ) -> None:
+        # values are stringified once here so that rendering the command needs no conversions
+        overrides: Dict[str, Any] = {
+            arg: str(val) if val is not None and not isinstance(val, (bool, str, list, tuple)) else val
+            for arg, val in spark_args.items()
+        }
+        self.spark_args = ChainMap(overrides, __defaults__)  # type: ignore[arg-type]
 
-        if (
-            main_file.startswith('s3')
-            or main_file.startswith('local:')
-            or os.path.isfile(os.path.expanduser(main_file))
-        ):
-            self.spark_args['main_file'] = main_file.replace(os.path.sep, '/')
+        if main_file.startswith(_REMOTE_PREFIXES) or os.path.isfile(os.path.expanduser(main_file)):
+            self.spark_args['main_file'] = _normalize_path(main_file)
         else:
             raise FileNotFoundError(f'File {main_file} does not exist.')
 
-        spark_home = self.spark_args['spark_home'].replace(os.path.sep, '/')
-        self.spark_bin = f'{spark_home}/bin/spark-submit'
-        if not os.path.isfile(self.spark_bin):
+        spark_home = _normalize_path(self.spark_args['spark_home'] or _get_spark_home())
+        self.spark_args['spark_home'] = spark_home
+        self.spark_bin = f'{spark_home}/{_SPARK_SUBMIT_BIN}'
+        if not _is_file(self.spark_bin):
             raise FileNotFoundError(
-                f'bin/spark-submit was not found in "{spark_home}". '
+                f'{_SPARK_SUBMIT_BIN} was not found in "{spark_home}". '
                 f'Please add SPARK_HOME to path or provide it as a keyword argument: spark_home'
             )
 
-        self.env_vars = os.environ.copy()
-        if 'JAVA_HOME' not in self.env_vars:
-            logging.warning('JAVA_HOME is not defined in environment variables.')
-
         self.is_yarn = 'yarn' in self.spark_args['master']
         self.is_k8s = 'k8s' in self.spark_args['master']
+        self._api_base = f"{self.spark_args['master'].replace('spark://', 'http://')}/v1/submissions"
+        self._yarn_rm_url = yarn_rm_url.rstrip('/') if yarn_rm_url else None
+        # standalone masters and YARN with `yarn_rm_url` are checked over HTTP, the rest with CLI commands
+        self._is_rest_polled = bool(self._yarn_rm_url) if self.is_yarn else not self.is_k8s
 
-        self.submit_cmd = self._get_submit_cmd()
         self.submit_response: Dict[str, Any] = {
             'output': '',
             'code': -1,
@@ -64,81 +139,210 @@ class SparkJob:
             'driver_state': '',
         }
         self.concluded = False
+        self._lock = threading.Lock()
+        self._min_poll_interval = min_poll_interval
+        self._last_poll = 0.0
+        self._poll_failures = 0
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # the read-only defaults and the lock cannot be pickled, so only the job's own arguments are kept
+        state = self.__dict__.copy()
+        state['spark_args'] = dict(self.spark_args.maps[0])
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        state['spark_args'] = ChainMap(state['spark_args'], __defaults__)  # type: ignore[arg-type]
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
 
     def _update_concluded(self) -> None:
-        self.concluded = self.submit_response['driver_state'] in __end_states__
+        self.concluded = self.submit_response['driver_state'] in _TERMINAL_NAMES
 
-    def _get_submit_cmd(self) -> str:
-        booleans = {arg for arg, val in self.spark_args.items() if isinstance(val, bool)}
-        exclude = {'spark_home', 'main_file', 'conf', 'main_file_args'} ^ booleans
+    def _set_driver_state(self, driver_state: str, keep_concluded: bool = False) -> str:
+        with self._lock:
+            if not (keep_concluded and self.concluded):
+                self.submit_response['driver_state'] = driver_state
+                self._update_concluded()
+            driver_state = self.submit_response['driver_state']
+        if self.concluded:
+            # concluded jobs are not polled again, so the poller thread can exit without waiting for their deadline
+            _POLLER.discard(self)
+        return driver_state
+
+    @cached_property
+    def env_vars(self) -> Dict[str, str]:
+        """Copy of the host environment variables, taken on first access"""
+        env = os.environ.copy()
+        if 'JAVA_HOME' not in env:
+            logging.warning('JAVA_HOME is not defined in environment variables.')
+        return env
+
+    @cached_property
+    def submit_cmd(self) -> str:
+        """spark-submit command, built on first access"""
+        return self._get_submit_cmd(' ')
+
+    @cached_property
+    def _multiline_submit_cmd(self) -> str:
+        return self._get_submit_cmd(' \\ \n')
+
+    @cached_property
+    def _argv(self) -> List[str]:
+        # option values, `conf` entries and `main_file_args` are written with shell quoting,
+        # so they are split the way a shell would split the displayed `submit_cmd`
+        argv = [self.spark_bin]
+        for option, val in self._get_options():
+            argv.append(option)
+            if val is not None:
+                argv.extend(shlex.split(val))
+
+        for conf in self.spark_args['conf']:
+            argv.append('--conf')
+            argv.extend(shlex.split(conf))
+
+        argv.append(self.spark_args['main_file'])
+        argv.extend(shlex.split(self.spark_args['main_file_args']))
+        return argv
+
+    def _get_options(self) -> List[Tuple[str, Optional[str]]]:
+        options: List[Tuple[str, Optional[str]]] = []
+        flags: List[Tuple[str, Optional[str]]] = []
+        for arg, val in self.spark_args.items():
+            if arg in __static_exclude__ or val is None:
+                continue
+            if isinstance(val, bool):
+                if val:
+                    flags.append((f"--{arg.replace('_', '-')}", None))
+            else:
+                options.append((f"--{arg.replace('_', '-')}", val))
+        return options + flags
 
-        args = [
-            f"--{arg.replace('_', '-')} {val}"
-            for arg, val in self.spark_args.items()
-            if arg not in exclude and val is not None
-        ]
-        confs = [f'--conf {c}' for c in self.spark_args['conf']]
-        boolean_args = [f"--{arg.replace('_', '-')}" for arg in booleans if self.spark_args[arg]]
+    def _get_submit_cmd(self, sep: str) -> str:
+        # each part is one option (with its value, if any), so that `sep` can break the command into lines
+        parts = [self.spark_bin]
+        parts.extend(option if val is None else f'{option} {val}' for option, val in self._get_options())
 
-        args_str = ' '.join(args)
-        bool_str = ' '.join(boolean_args)
-        conf_str = ' '.join(confs)
+        if self.spark_args['conf']:
+            parts.append('--conf ' + f'{sep}--conf '.join(self.spark_args['conf']))
 
-        cmd = f"{self.spark_bin} {args_str} {bool_str} {conf_str} {self.spark_args['main_file']} {self.spark_args['main_file_args']}"
-        return cmd
+        if self.spark_args['main_file_args']:
+            parts.append(f"{self.spark_args['main_file']} {self.spark_args['main_file_args']}")
+        else:
+            parts.append(self.spark_args['main_file'])
+        return sep.join(parts)
 
     def _get_api_url(self, endpoint: str) -> str:
-        return f"{self.spark_args['master'].replace('spark://', 'http://')}/v1/submissions/{endpoint}/{self.get_id()}"
+        return f'{self._api_base}/{endpoint}/{self.get_id()}'
 
     def _get_status_response(self) -> str:
         if self.is_yarn:
-            status_cmd = f'yarn application -status {self.get_id()}'
+            status_cmd = ['yarn', 'application', '-status', self.get_id()]
             response, _ = _execute_cmd(status_cmd)
         elif self.is_k8s:
-            status_cmd = f"{self.spark_bin} --master status --{self.spark_args['master']} {self.get_id()}"
+            status_cmd = [self.spark_bin, '--master', self.spark_args['master'], '--status', self.get_id()]
             response, _ = _execute_cmd(status_cmd)
         else:
             status_url = self._get_api_url('status')
-            response = requests.get(status_url).text
+            resp = _get_session().get(status_url, timeout=_HTTP_TIMEOUT)
+            resp.raise_for_status()
+            response = resp.text
         return response
 
     def _check_submit(self) -> None:
-        if self.get_id() and not self.concluded:
-            response = self._get_status_response()
-            driver_state = re.findall(r'"driverState" : "(.+)"', response)
+        if not self.get_id() or self.concluded:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_poll < self._min_poll_interval:
+                return
+            self._last_poll = now
 
-            if len(driver_state) < 1:
-                logging.warning(f"driverState not found in output \"{response}\" for job \"{self.spark_args['name']}\"")
-                self.submit_response['driver_state'] = 'UNKNOWN'
+        transient_errors: Tuple[Type[Exception], ...] = ()
+        if self._is_rest_polled:
+            import requests
+
+            transient_errors = (requests.Timeout, requests.ConnectionError, requests.HTTPError)
+
+        try:
+            if self.is_yarn and self._yarn_rm_url:
+                driver_state = self._get_yarn_driver_state()
             else:
-                self.submit_response['driver_state'] = driver_state[0]
-            self._update_concluded()
+                driver_state = self._parse_driver_state(self._get_status_response())
+        except transient_errors as err:
+            # keep the last known state and let the next poll retry, unless the master keeps failing
+            self._poll_failures += 1
+            logging.warning(f"Could not check the state of job \"{self.spark_args['name']}\": {err}")
+            if self._poll_failures < _MAX_POLL_FAILURES:
+                return
+            driver_state = 'UNKNOWN'
+        else:
+            self._poll_failures = 0
 
-    def _poll_state(self, seconds: int) -> None:
-        while not self.concluded:
-            time.sleep(seconds)
-            self._check_submit()
+        # the job may have been killed while the state was being fetched
+        self._set_driver_state(driver_state, keep_concluded=True)
 
-    def _get_submission_id(self, output: str) -> List[str]:
+    def _parse_driver_state(self, response: str) -> str:
+        driver_state: Optional[str] = None
+        if self.is_yarn or self.is_k8s:
+            match = _DRIVER_STATE_RE.search(response)
+            if match:
+                driver_state = match.group(1)
+        else:
+            # the REST submission server answers with a plain JSON document
+            try:
+                status = json.loads(response)
+            except ValueError:
+                status = None
+            if isinstance(status, dict):
+                driver_state = status.get('driverState')
+
+        if driver_state is None:
+            logging.warning(f"driverState not found in output \"{response}\" for job \"{self.spark_args['name']}\"")
+            return 'UNKNOWN'
+        return driver_state
+
+    def _get_yarn_driver_state(self) -> str:
+        app_url = f'{self._yarn_rm_url}/ws/v1/cluster/apps/{self.get_id()}'
+        try:
+            resp = _get_session().get(app_url, timeout=_HTTP_TIMEOUT)
+            resp.raise_for_status()
+            app = resp.json()['app']
+        except (ValueError, KeyError):
+            logging.warning(f"Application state not found at \"{app_url}\" for job \"{self.spark_args['name']}\"")
+            return 'UNKNOWN'
+
+        if app.get('state') == 'FINISHED':
+            return __yarn_final_statuses__.get(app.get('finalStatus', ''), 'UNKNOWN')
+        return __yarn_states__.get(app.get('state', ''), 'UNKNOWN')
+
+    def _get_submission_id(self, output: str) -> Optional[str]:
         if self.is_yarn:
-            re_exp = r'(application[0-9_]+)'
+            pattern = _YARN_ID_RE
         elif self.is_k8s:
-            re_exp = r'\s*pod name: ((.+?)-([a-z0-9]+)-driver)'
+            pattern = _K8S_ID_RE
         else:
-            re_exp = r'"submissionId" : "(.+)"'
-        return re.findall(re_exp, output)
+            pattern = _STANDALONE_ID_RE
+        match = pattern.search(output)
+        return match.group(1) if match else None
 
     def _get_kill_response(self) -> Tuple[str, int]:
         if self.is_yarn:
-            kill_cmd = f'yarn application -kill {self.get_id()}'
+            kill_cmd = ['yarn', 'application', '-kill', self.get_id()]
             return _execute_cmd(kill_cmd)
 
         if self.is_k8s:
-            kill_cmd = f"{self.spark_bin} --master {self.spark_args['master']} --kill {self.get_id()}"
+            kill_cmd = [self.spark_bin, '--master', self.spark_args['master'], '--kill', self.get_id()]
             return _execute_cmd(kill_cmd)
 
+        import requests
+
         kill_url = self._get_api_url('kill')
-        resp = requests.get(kill_url)
+        try:
+            resp = _get_session().post(kill_url, timeout=_HTTP_TIMEOUT)
+        except (requests.Timeout, requests.ConnectionError) as err:
+            return str(err), -1
         return resp.text, resp.status_code
 
     def submit(
@@ -148,27 +352,38 @@ class SparkJob:
         extra_env_vars: Optional[Dict[str, str]] = None,
         poll_time: int = 0,
         timeout: Optional[int] = None,
+        max_output_lines: Optional[int] = None,
+        on_output: Optional[Callable[[str], None]] = None,
     ) -> None:
         """Submits the current Spark job to Spark master.
            If `use_env_vars=True`, the host environment variables in `os.environ` will be used
-           with the spark-submit shell.
+           with the spark-submit process.
            Additional environment variables can be supplied with the dictionary `extra_env_vars`
            as key-value pairs (if `use_env_vars=True`, any common keys between `os.environ` and
            `extra_env_vars` will be overwritten by the latter).
            The state of the Spark job can be  polled and updated in the background if a positive
-           `poll_time` is given (in seconds) and deploy mode is cluster.
+           `poll_time` is given (in seconds) and deploy mode is cluster; the interval then doubles after
+           every poll, up to 30 seconds (or `poll_time`, if greater). All polled jobs share a single
+           background thread.
            If a positive `timeout` is given (in seconds), a `subprocess.TimeoutExpired` exception
            will be raised if the Spark job does not terminate within that time.
+           The spark-submit stdout is read line by line as it is produced; if `max_output_lines` is
+           given, only that many trailing lines are kept for `get_output`, which bounds memory for
+           jobs with verbose logs. Each line is also passed to `on_output`, if given.
 
         Parameters
             use_env_vars (bool): whether the environment variables from `os.environ` should be used with spark-submit
                                  (default: False)
             extra_env_vars (Dict): a dictionary of additional environment variables to use with spark-submit
                                    (default: None)
-            poll_time (int): how often to poll the Spark driver state in a background thread
+            poll_time (int): initial interval to poll the Spark driver state in a background thread
                              (default: 0, don't poll in a background thread)
             timeout (int): exception is raised if spark-submit does not terminate after `timeout` seconds
                            (default: None)
+            max_output_lines (int): maximum number of trailing stdout lines to keep
+                                    (default: None, keep all output)
+            on_output (Callable): function called with each line of the spark-submit stdout
+                                  (default: None)
 
         Returns:
             None
@@ -185,36 +400,45 @@ class SparkJob:
         else:
             env = None
 
-        self.submit_response['driver_state'] = 'SUBMITTED'
-        self._update_concluded()
-
-        output, code = _execute_cmd(self.submit_cmd, timeout=timeout, env=env, bufsize=-1, universal_newlines=True)
+        self._set_driver_state('SUBMITTED')
+
+        # the submission ID is picked up while streaming, so it is found even if its line is not retained
+        submission_id: Optional[str] = None
+        is_client = self.spark_args['deploy_mode'] == 'client'
+
+        def _on_line(line: str) -> None:
+            nonlocal submission_id
+            if submission_id is None and not is_client:
+                submission_id = self._get_submission_id(line)
+            if on_output:
+                on_output(line)
+
+        # on Windows, the command line is passed as-is, since POSIX splitting would drop backslashes in paths
+        output, code = _execute_cmd(
+            self.submit_cmd if _IS_WINDOWS else self._argv,
+            timeout=timeout,
+            maxlen=max_output_lines,
+            on_line=_on_line,
+            env=env,
+        )
         self.submit_response['output'] = output
         self.submit_response['code'] = code
 
         if code != 0:
-            self.submit_response['driver_state'] = 'ERROR'
-            self._update_concluded()
+            self._set_driver_state('ERROR')
             raise SparkSubmitError(f'{output}\nReturn code: {code}')
 
-        if self.spark_args['deploy_mode'] == 'client':
-            self.submit_response['driver_state'] = 'FINISHED'
-            self._update_concluded()
+        if is_client:
+            self._set_driver_state('FINISHED')
 
         else:
-            submission_id = self._get_submission_id(output)
-            if len(submission_id) < 1:
+            if submission_id is None:
                 logging.warning(f"submissionId not found in output \"{output}\" for job \"{self.spark_args['name']}\"")
-                self.submit_response['driver_state'] = 'UNKNOWN'
-                self._update_concluded()
+                self._set_driver_state('UNKNOWN')
             else:
-                self.submit_response['submission_id'] = submission_id[0]
-                if poll_time > 0 and not (self.is_yarn or self.is_k8s):
-                    threading.Thread(
-                        name=self.spark_args['name'],
-                        target=self._poll_state,
-                        args=(poll_time,),
-                    ).start()
+                self.submit_response['submission_id'] = submission_id
+                if poll_time > 0 and self._is_rest_polled:
+                    _POLLER.schedule(self, poll_time)
 
     def get_submit_cmd(self, multiline: bool = False) -> str:
         """Gets the associated spark-submit command
@@ -227,9 +451,7 @@ class SparkJob:
             str: spark-submit command
         """
         if multiline:
-            return self.submit_cmd.replace(' --', ' \ \n--').replace(
-                ' ' + self.spark_args['main_file'], ' \ \n' + self.spark_args['main_file']
-            )
+            return self._multiline_submit_cmd
         return self.submit_cmd
 
     def get_state(self) -> str:
@@ -238,8 +460,10 @@ class SparkJob:
         Returns:
             str: Spark job driver state
         """
-        self._check_submit()
-        return self.submit_response['driver_state']
+        if not self.concluded:
+            self._check_submit()
+        with self._lock:
+            return self.submit_response['driver_state']
 
     def get_output(self) -> str:
         """Gets the spark-submit stdout
@@ -287,7 +511,74 @@ class SparkJob:
                     f'\nReturn code: {code}'
                 )
 
-            self.submit_response['driver_state'] = 'KILLED'
-            self._update_concluded()
+            # a poll may have recorded the end of the job while the kill request was sent
+            driver_state = self._set_driver_state('KILLED', keep_concluded=True)
+            if driver_state != 'KILLED':
+                logging.warning(
+                    f"Spark job \"{self.spark_args['name']}\" "
+                    f'concluded with state "{driver_state}" before it was killed'
+                )
         else:
             raise SparkJobKillError(f"Spark job \"{self.spark_args['name']}\" has no submission ID to kill.")
+
+
+class _Poller:
+    """Polls the driver state of submitted jobs on a single background thread,
+    ordered by their next poll deadline"""
+
+    def __init__(self) -> None:
+        # entries: (deadline, tie-breaker, job, current interval, initial interval)
+        self._heap: List[Tuple[float, int, SparkJob, float, float]] = []
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def schedule(self, job: SparkJob, interval: float, initial_interval: Optional[float] = None) -> None:
+        with self._lock:
+            entry = (time.monotonic() + interval, next(self._counter), job, interval, initial_interval or interval)
+            heapq.heappush(self._heap, entry)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='spark-submit-poller')
+                self._thread.start()
+        self._wake.set()
+
+    def discard(self, job: SparkJob) -> None:
+        with self._lock:
+            heap = [entry for entry in self._heap if entry[2] is not job]
+            if len(heap) == len(self._heap):
+                return
+            heapq.heapify(heap)
+            self._heap = heap
+        self._wake.set()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._heap:
+                    self._thread = None
+                    return
+                deadline, _, job, interval, initial_interval = self._heap[0]
+                delay = deadline - time.monotonic()
+                if delay <= 0 or job.concluded:
+                    heapq.heappop(self._heap)
+                    delay = 0
+
+            if delay > 0:
+                # woken up early if a job with an earlier deadline is scheduled
+                self._wake.wait(delay)
+                self._wake.clear()
+                continue
+
+            if job.concluded:
+                continue
+            try:
+                job._check_submit()
+            except Exception:
+                logging.exception(f"Error polling the state of job \"{job.spark_args['name']}\"")
+            if not job.concluded:
+                next_interval = min(interval * 2, max(initial_interval, _MAX_POLL_INTERVAL))
+                self.schedule(job, next_interval, initial_interval)
+
+
+_POLLER = _Poller()
@@ -1,70 +1,141 @@
 """System related functionalities"""
 import logging
 import os
-import platform
 import re
+import shlex
 import subprocess
 import sys
-from typing import Any, Dict, Optional, Tuple
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple, Union
 
+_IS_WINDOWS = os.name == 'nt'
 
-def _execute_cmd(cmd: str, timeout: Optional[int] = None, silent: bool = True, **kwargs: Any) -> Tuple[str, int]:
+# only non-POSIX path separators need to be normalized to '/'
+_NEED_SEP_FIX = os.path.sep != '/'
 
-    with subprocess.Popen(
-        cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        shell=True,
-        **kwargs,
-    ) as process:
-        output, _ = process.communicate(timeout=timeout)
-        res = output.decode() if isinstance(output, bytes) else output
-        code = process.returncode
+# spark-submit launcher relative to SPARK_HOME
+_SPARK_SUBMIT_BIN = 'bin/spark-submit.cmd' if _IS_WINDOWS else 'bin/spark-submit'
+
+# paths confirmed to exist by `_is_file`
+_FOUND_FILES: Set[str] = set()
+
+# patterns to extract framework versions from the output of `system_info` commands
+_INFO_PATTERNS = {
+    'Spark version': re.compile('  version (.+)', re.IGNORECASE),
+    'Scala version': re.compile('scala version (.+?),', re.IGNORECASE),
+    'Java version': re.compile('version "(.+)"', re.IGNORECASE),
+    'PySpark version': re.compile('Version: (.+)', re.IGNORECASE),
+}
+
+
+def _execute_cmd(
+    cmd: Union[str, List[str]],
+    timeout: Optional[int] = None,
+    silent: bool = True,
+    maxlen: Optional[int] = None,
+    on_line: Optional[Callable[[str], None]] = None,
+    **kwargs: Any,
+) -> Tuple[str, int]:
+    # commands are run without a shell; on Windows, a string is passed as-is to CreateProcess
+    if isinstance(cmd, str) and not _IS_WINDOWS:
+        cmd = shlex.split(cmd)
+
+    # output is streamed line by line, keeping at most `maxlen` trailing lines in memory
+    lines: Deque[str] = deque(maxlen=maxlen)
+    timed_out = threading.Event()
+    try:
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            **kwargs,
+        )
+    except OSError as err:
+        # report commands that cannot be started like a shell would, instead of raising
+        res, code = str(err), 127
+    else:
+
+        def _kill() -> None:
+            timed_out.set()
+            process.kill()
+
+        with process:
+            timer = threading.Timer(timeout, _kill) if timeout else None
+            if timer:
+                timer.start()
+            try:
+                for line in process.stdout:  # type: ignore[union-attr]
+                    lines.append(line)
+                    if on_line:
+                        on_line(line)
+                code = process.wait()
+            finally:
+                if timer:
+                    timer.cancel()
+        res = ''.join(lines)
+
+        if timeout and timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout, output=res)
 
     if code != 0 and not silent:
         logging.warning(res)
     return res, code
 
 
+def _normalize_path(path: str) -> str:
+    return path.replace(os.path.sep, '/') if _NEED_SEP_FIX else path
+
+
+def _get_spark_home() -> str:
+    return os.environ.get('SPARK_HOME') or os.path.expanduser('~/spark_home')
+
+
+def _is_file(path: str) -> bool:
+    # only files that were found are remembered, so a missing launcher is looked up again next time
+    if path in _FOUND_FILES:
+        return True
+    if os.path.isfile(path):
+        _FOUND_FILES.add(path)
+        return True
+    return False
+
+
+@lru_cache(maxsize=1)
 def system_info() -> str:
     """Collects Spark related system information, such as versions of
-       spark-submit, Scala, Java, PySpark, Python and OS
+       spark-submit, Scala, Java, PySpark, Python and OS.
+       The result is cached for the lifetime of the process; use `system_info.cache_clear()`
+       to collect it again, e.g. after changing SPARK_HOME or JAVA_HOME.
 
     Returns:
         str: system information
     """
+    import platform
 
-    def _quote_spaces(text: str) -> str:
-        return f'"{text}"' if ' ' in text else text
-
-    spark_home = os.getenv('SPARK_HOME', os.path.expanduser('~/spark_home')).replace(os.path.sep, '/')
-    spark_bin = _quote_spaces(f'{spark_home}/bin/spark-submit')
-    info_cmd = f'{spark_bin} --version'
-
-    java_home = os.getenv('JAVA_HOME', '').replace(os.path.sep, '/')
-    if java_home:
-        java_bin = f'{java_home}/bin/java'
-        info_cmd += f' ; {_quote_spaces(java_bin)} -version'
-    else:
-        info_cmd += ' ; java -version'
-
-    info_cmd += f' ; {_quote_spaces(sys.executable)} -m pip show pyspark'
-    if platform.system() == 'Windows':
-        info_cmd = info_cmd.replace(' ; ', ' & ')
+    spark_home = _normalize_path(_get_spark_home())
+    java_home = _normalize_path(os.getenv('JAVA_HOME', ''))
+    java_bin = f'{java_home}/bin/java' if java_home else 'java'
 
-    info_stdout, _ = _execute_cmd(info_cmd, silent=False)
-    info_re = {
-        'Spark version': '  version (.+)',
-        'Scala version': 'scala version (.+?),',
-        'Java version': 'version "(.+)"',
-        'PySpark version': 'Version: (.+)',
-    }
+    info_cmds = [
+        [f'{spark_home}/{_SPARK_SUBMIT_BIN}', '--version'],
+        [java_bin, '-version'],
+        [sys.executable, '-m', 'pip', 'show', 'pyspark'],
+    ]
+    # the probes are independent and mostly JVM/interpreter start-up time, so run them concurrently
+    with ThreadPoolExecutor(max_workers=len(info_cmds)) as pool:
+        info_stdout = '\n'.join(res for res, _ in pool.map(partial(_execute_cmd, silent=False), info_cmds))
 
     sys_info: Dict[str, str] = {}
-    for key, val in info_re.items():
-        match = re.findall(val, info_stdout, re.IGNORECASE)
+    for key, pattern in _INFO_PATTERNS.items():
+        match = pattern.search(info_stdout)
         if match:
-            sys_info[key] = match[0].strip()
+            sys_info[key] = match.group(1).strip()
         else:
             sys_info[key] = key.split(' ')[0] + ' not detected!'
 
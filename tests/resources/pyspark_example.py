@@ -13,12 +13,18 @@ partitions = 2
 n = accuracy * partitions
 
 
-def f(_):
-    x = random() * 2 - 1
-    y = random() * 2 - 1
-    return 1 if x**2 + y**2 <= 1 else 0
-
-
-count = spark.sparkContext.parallelize(range(1, n + 1), partitions).map(f).reduce(add)
+def count_hits(samples):
+    hits = 0
+    for _ in range(samples):
+        x = random() * 2 - 1
+        y = random() * 2 - 1
+        if x**2 + y**2 <= 1:
+            hits += 1
+    return hits
+
+
+# one sample count per partition, so that each Python worker runs its loop locally
+# instead of receiving and returning every sample through the JVM
+count = spark.sparkContext.parallelize([accuracy] * partitions, partitions).map(count_hits).reduce(add)
 print(f'Pi is about {4.0 * count / n}')
 spark.stop()
@@ -1,10 +1,17 @@
 """Unit tests for spark_submit/sparkjob.py"""
+import copy
+import json
 import os
+import pickle
+import sys
 
 import pyspark
 import pytest
 
-from spark_submit.sparkjob import SparkJob
+from spark_submit import sparkjob
+from spark_submit._defaults import __defaults__
+from spark_submit.sparkjob import _MAX_POLL_FAILURES, SparkJob
+from spark_submit.system import _SPARK_SUBMIT_BIN
 
 MAIN_FILE = 'resources/pyspark_example.py'
 SPARK_HOME = os.path.dirname(pyspark.__file__).replace(os.path.sep, '/')
@@ -32,14 +39,33 @@ def test_missing_spark_home():
     with pytest.raises(FileNotFoundError) as err:
         SparkJob(main_file=MAIN_FILE, spark_home=spark_home)
 
-    assert f'bin/spark-submit was not found in "{spark_home}"' in str(err.value)
+    assert f'{_SPARK_SUBMIT_BIN} was not found in "{spark_home}"' in str(err.value)
 
 
 def test_check_spark_submit_cmd():
-    expected_cmd = f"{SPARK_HOME}/bin/spark-submit --master local[*] --name spark-submit-task --deploy-mode client --driver-memory 1g --executor-memory 1g --executor-cores 1 --total-executor-cores 4 --verbose --conf 'foo'='bar' resources/pyspark_example.py conf.json"
+    expected_cmd = f"{SPARK_HOME}/{_SPARK_SUBMIT_BIN} --master local[*] --name spark-submit-task --deploy-mode client --driver-memory 1g --executor-memory 1g --executor-cores 1 --total-executor-cores 4 --verbose --conf 'foo'='bar' resources/pyspark_example.py conf.json"
     assert expected_cmd == MOCK_JOB.get_submit_cmd()
 
 
+def test_check_spark_submit_cmd_multiline():
+    multiline_cmd = MOCK_JOB.get_submit_cmd(multiline=True)
+    assert multiline_cmd.endswith(' \\ \nresources/pyspark_example.py conf.json')
+    assert multiline_cmd.replace(' \\ \n', ' ') == MOCK_JOB.get_submit_cmd()
+
+
+def test_spark_submit_argv():
+    assert MOCK_JOB._argv[0] == f'{SPARK_HOME}/{_SPARK_SUBMIT_BIN}'
+    assert MOCK_JOB._argv[-5:] == ['--verbose', '--conf', 'foo=bar', MAIN_FILE, 'conf.json']
+
+
+def test_spark_args_keep_defaults_intact():
+    job = SparkJob(main_file=MAIN_FILE, spark_home=SPARK_HOME, name='other-name')
+    assert job.spark_args['name'] == 'other-name'
+    assert job.spark_args['master'] == __defaults__['master']
+    assert __defaults__['name'] == 'spark-submit-task'
+    assert 'main_file' not in __defaults__
+
+
 def test_intial_get_state():
     assert MOCK_JOB.get_state() == ''
 
@@ -54,3 +80,210 @@ def get_intial_code():
 
 def test_intial_get_id():
     assert MOCK_JOB.get_id() == ''
+
+
+def test_spark_submit_cmd_without_optional_parts():
+    job = SparkJob(main_file=MAIN_FILE, spark_home=SPARK_HOME)
+    assert '  ' not in job.get_submit_cmd()
+    assert job.get_submit_cmd().endswith(f' {MAIN_FILE}')
+
+
+def test_concluded_get_state_skips_status_check():
+    job = SparkJob(main_file=MAIN_FILE, spark_home=SPARK_HOME, master='spark://localhost:6066', deploy_mode='cluster')
+    job.submit_response['submission_id'] = 'driver-0'
+    job.submit_response['driver_state'] = 'FINISHED'
+    job.concluded = True
+
+    def _fail():
+        raise AssertionError('status should not be requested for a concluded job')
+
+    job._get_status_response = _fail
+    assert job.get_state() == 'FINISHED'
+
+
+def test_spark_submit_argv_splits_quoted_values():
+    job = SparkJob(main_file=MAIN_FILE, spark_home=SPARK_HOME, name="'my job'", driver_java_options="'-Dx=1 -Dy=2'")
+    assert job._argv[job._argv.index('--name') + 1] == 'my job'
+    assert job._argv[job._argv.index('--driver-java-options') + 1] == '-Dx=1 -Dy=2'
+    assert "--name 'my job'" in job.get_submit_cmd()
+
+
+def test_submit_streams_output():
+    job = SparkJob(main_file=MAIN_FILE, spark_home=SPARK_HOME)
+    lines = []
+    job.submit(max_output_lines=1, on_output=lines.append)
+    assert job.get_code() == 0
+    assert len(lines) >= 1
+    assert job.get_output() == lines[-1]
+    assert job.get_state() == 'FINISHED'
+
+
+def test_spark_home_found_after_failed_attempt(tmp_path):
+    spark_home = tmp_path.as_posix()
+    with pytest.raises(FileNotFoundError):
+        SparkJob(main_file=MAIN_FILE, spark_home=spark_home)
+
+    (tmp_path / _SPARK_SUBMIT_BIN).parent.mkdir()
+    (tmp_path / _SPARK_SUBMIT_BIN).touch()
+    assert SparkJob(main_file=MAIN_FILE, spark_home=spark_home).spark_bin == f'{spark_home}/{_SPARK_SUBMIT_BIN}'
+
+
+@pytest.mark.parametrize(
+    'main_file',
+    [
+        'abfs://c@a.dfs.core.windows.net/x.py',
+        'wasbs://c@a.blob.core.windows.net/x.py',
+    ],
+)
+def test_remote_main_file_not_checked_locally(main_file):
+    assert SparkJob(main_file=main_file, spark_home=SPARK_HOME).spark_args['main_file'] == main_file
+
+
+def _cluster_job(**kwargs):
+    job = SparkJob(
+        main_file=MAIN_FILE,
+        spark_home=SPARK_HOME,
+        master='spark://127.0.0.1:1',
+        deploy_mode='cluster',
+        min_poll_interval=0,
+        **kwargs,
+    )
+    job.submit_response['submission_id'] = 'driver-0'
+    job.submit_response['driver_state'] = 'RUNNING'
+    return job
+
+
+def test_unreachable_master_gives_up_as_unknown():
+    job = _cluster_job()
+    states = [job.get_state() for _ in range(_MAX_POLL_FAILURES)]
+    assert states[:-1] == ['RUNNING'] * (_MAX_POLL_FAILURES - 1)
+    assert states[-1] == 'UNKNOWN'
+    assert job.concluded
+
+
+def _mock_session(monkeypatch, status_code, content):
+    import requests
+
+    resp = requests.Response()
+    resp.status_code = status_code
+    resp._content = content.encode()
+
+    class _Session:
+        def get(self, url, timeout):
+            return resp
+
+    monkeypatch.setattr(sparkjob, '_get_session', _Session)
+
+
+def test_http_error_keeps_last_state(monkeypatch):
+    _mock_session(monkeypatch, 502, '<html>Bad Gateway</html>')
+    job = _cluster_job()
+    assert job.get_state() == 'RUNNING'
+    assert not job.concluded
+
+
+@pytest.mark.parametrize(
+    'response, driver_state',
+    [
+        ('{"action": "SubmissionStatusResponse", "driverState": "FINISHED"}', 'FINISHED'),
+        ('{"action": "SubmissionStatusResponse"}', 'UNKNOWN'),
+        ('[1, 2]', 'UNKNOWN'),
+        ('<html>Bad Gateway</html>', 'UNKNOWN'),
+    ],
+)
+def test_parse_driver_state(response, driver_state):
+    assert _cluster_job()._parse_driver_state(response) == driver_state
+
+
+@pytest.mark.parametrize(
+    'app, driver_state',
+    [
+        ({'state': 'ACCEPTED', 'finalStatus': 'UNDEFINED'}, 'SUBMITTED'),
+        ({'state': 'RUNNING', 'finalStatus': 'UNDEFINED'}, 'RUNNING'),
+        ({'state': 'FINISHED', 'finalStatus': 'SUCCEEDED'}, 'FINISHED'),
+        ({'state': 'FINISHED', 'finalStatus': 'FAILED'}, 'FAILED'),
+        ({'state': 'KILLED', 'finalStatus': 'KILLED'}, 'KILLED'),
+        ({'state': 'SOMETHING_NEW'}, 'UNKNOWN'),
+    ],
+)
+def test_yarn_driver_state(monkeypatch, app, driver_state):
+    _mock_session(monkeypatch, 200, json.dumps({'app': app}))
+    job = _cluster_job(yarn_rm_url='http://rm-host:8088/')
+    assert job._get_yarn_driver_state() == driver_state
+
+
+def test_poller_exits_after_kill():
+    job = _cluster_job()
+    job._get_kill_response = lambda: ('', 200)
+    sparkjob._POLLER.schedule(job, 30)
+    poller_thread = sparkjob._POLLER._thread
+
+    job.kill()
+    poller_thread.join(timeout=1)
+    assert not poller_thread.is_alive()
+    assert job.get_state() == 'KILLED'
+
+
+def test_cli_state_check_does_not_need_requests(monkeypatch):
+    job = SparkJob(main_file=MAIN_FILE, spark_home=SPARK_HOME, master='k8s://127.0.0.1:1', deploy_mode='cluster')
+    job.submit_response['submission_id'] = 'spark-pi-1-driver'
+    job._get_status_response = lambda: '"driverState" : "RUNNING"'
+    monkeypatch.setitem(sys.modules, 'requests', None)
+    assert job.get_state() == 'RUNNING'
+
+
+def test_windows_submit_keeps_backslash_paths(monkeypatch):
+    job = SparkJob(main_file=MAIN_FILE, spark_home=SPARK_HOME, jars=r'C:\libs\a.jar')
+    commands = []
+
+    def _execute(cmd, **kwargs):
+        commands.append(cmd)
+        return '', 0
+
+    monkeypatch.setattr(sparkjob, '_IS_WINDOWS', True)
+    monkeypatch.setattr(sparkjob, '_execute_cmd', _execute)
+    job.submit()
+    assert commands == [job.get_submit_cmd()]
+    assert r'--jars C:\libs\a.jar' in commands[0]
+
+
+@pytest.mark.parametrize('clone', [lambda job: pickle.loads(pickle.dumps(job)), copy.deepcopy])
+def test_spark_job_can_be_copied(clone):
+    job = _cluster_job(name='copied-job')
+    job_copy = clone(job)
+    assert job_copy.spark_args['name'] == 'copied-job'
+    assert job_copy.spark_args['executor_memory'] == __defaults__['executor_memory']
+    assert job_copy.get_submit_cmd() == job.get_submit_cmd()
+    assert job_copy.submit_response == job.submit_response
+
+
+def test_kill_keeps_state_concluded_meanwhile():
+    job = _cluster_job()
+
+    def _kill_response():
+        job._set_driver_state('FINISHED', keep_concluded=True)
+        return '', 200
+
+    job._get_kill_response = _kill_response
+    job.kill()
+    assert job.get_state() == 'FINISHED'
+
+
+@pytest.mark.parametrize(
+    'driver_state, concluded',
+    [
+        ('SUBMITTED', False),
+        ('RUNNING', False),
+        ('RELAUNCHING', False),
+        ('FINISHED', True),
+        ('UNKNOWN', True),
+        ('KILLED', True),
+        ('FAILED', True),
+        ('ERROR', True),
+        ('TERMINAL', False),
+    ],
+)
+def test_terminal_driver_states(driver_state, concluded):
+    job = SparkJob(main_file=MAIN_FILE, spark_home=SPARK_HOME)
+    job._set_driver_state(driver_state)
+    assert job.concluded is concluded
@@ -1,5 +1,8 @@
 """Unit tests for spark_submit/system.py"""
 import getpass
+import subprocess
+
+import pytest
 
 from spark_submit.system import _execute_cmd, system_info
 
@@ -11,6 +14,39 @@ def test_execute_cmd():
     assert getpass.getuser() in res
 
 
+def test_execute_cmd_keeps_last_lines():
+    res, code = _execute_cmd(['sh', '-c', 'for i in 1 2 3 4 5; do echo $i; done'], maxlen=2)
+    assert code == 0
+    assert res == '4\n5\n'
+
+
+def test_execute_cmd_streams_lines():
+    lines = []
+    _execute_cmd(['sh', '-c', 'echo foo; echo bar >&2'], on_line=lines.append)
+    assert lines == ['foo\n', 'bar\n']
+
+
+def test_execute_cmd_timeout():
+    with pytest.raises(subprocess.TimeoutExpired) as err:
+        _execute_cmd(['sh', '-c', 'echo started; exec sleep 10'], timeout=1)
+
+    assert err.value.output == 'started\n'
+
+
+def test_execute_cmd_missing_command():
+    res, code = _execute_cmd(['no-such-command-spark-submit'])
+    assert code == 127
+    assert res
+
+
+def test_execute_cmd_callback_error_is_raised():
+    def _fail(line):
+        raise PermissionError('callback failed')
+
+    with pytest.raises(PermissionError):
+        _execute_cmd(['sh', '-c', 'echo foo'], on_line=_fail)
+
+
 def test_system_info():
     keys = ['Spark version', 'Scala version', 'Java version', 'PySpark version']
     ans = system_info()